@@ -42,6 +42,11 @@ class Settings(BaseSettings):
     
     # Database (for direct connection if needed)
     database_url: Optional[str] = Field(default=None, description="Direct database URL")
+    db_pool_size: int = Field(default=10, description="Persistent connections kept in the pool")
+    db_max_overflow: int = Field(default=20, description="Extra connections allowed above pool size")
+    db_pool_timeout: int = Field(default=30)  # seconds
+    db_pool_recycle: int = Field(default=1800)  # seconds
+    db_pool_pre_ping: bool = Field(default=True)
     
     # JWT Configuration
     jwt_secret_key: str = Field(default="development-secret-key-change-in-production", description="JWT secret key")
@@ -144,6 +149,17 @@ class Settings(BaseSettings):
             return self.database_url.replace("postgresql://", "postgresql+asyncpg://")
         return None
     
+    @property
+    def database_engine_options(self) -> dict:
+        """Get connection pool options for SQLAlchemy create_engine."""
+        return {
+            "pool_size": self.db_pool_size,
+            "max_overflow": self.db_max_overflow,
+            "pool_timeout": self.db_pool_timeout,
+            "pool_recycle": self.db_pool_recycle,
+            "pool_pre_ping": self.db_pool_pre_ping,
+        }
+    
     def get_supabase_headers(self) -> dict:
         """Get headers for Supabase requests."""
         return {
@@ -6,9 +6,9 @@ Catches and formats all exceptions consistently.
 import logging
 import traceback
 from typing import Any, Dict
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from fastapi import status
 import json
 
@@ -17,20 +17,40 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
+class ErrorHandlerMiddleware:
     """
     Middleware to handle all uncaught exceptions and format error responses.
+    Implemented as pure ASGI to avoid BaseHTTPMiddleware's per-request task
+    group and response wrapping.
     """
     
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process the request and handle any exceptions.
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
-            return await self.handle_exception(request, exc)
+            # Headers already went out; a new response can't be sent
+            if response_started:
+                raise
+            response = await self.handle_exception(Request(scope, receive), exc)
+            await response(scope, receive, send)
     
     async def handle_exception(self, request: Request, exc: Exception) -> JSONResponse:
         """